@@ -6,35 +6,130 @@ This script demonstrates the chatbot's capabilities without requiring
 an API key by showing example conversations and features.
 """
 
+import argparse
+import os
+import select
+import sys
 import time
 
+try:
+    import msvcrt  # Windows can't select() on stdin, so poll the console
+except ImportError:
+    msvcrt = None
+
+
+def _speed_from_env() -> float:
+    """Read the delay multiplier from DEMO_SPEED, defaulting to 1."""
+    try:
+        return max(0.0, float(os.getenv("DEMO_SPEED", "1")))
+    except ValueError:
+        return 1.0
+
+
+# Multiplier applied to every delay in the demo: 1 is normal speed and 0
+# skips the delays. Delays are always skipped when stdout isn't a terminal.
+SPEED = _speed_from_env() if sys.stdout.isatty() else 0.0
+
+# Number of lines revealed together when animating a section
+LINES_PER_BATCH = 4
+
+
+def pause(seconds: float):
+    """Sleep for ``seconds``, scaled by SPEED."""
+    if SPEED > 0:
+        time.sleep(seconds * SPEED)
+
+
+def wait_or_enter(prompt: str, timeout: float):
+    """Show ``prompt`` and wait for Enter, advancing after ``timeout`` seconds."""
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+
+    if msvcrt is not None:
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if msvcrt.kbhit() and msvcrt.getwch() in "\r\n":
+                break
+            time.sleep(0.05)
+        print()
+        return
+
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if ready:
+        sys.stdin.readline()  # The terminal already echoed the newline
+    else:
+        print()
+
 
 def print_typing_animation(text: str, delay: float = 0.03):
-    """Print text with a typing animation effect."""
-    for char in text:
-        print(char, end="", flush=True)
-        time.sleep(delay)
+    """Print text with a typing animation effect.
+
+    Characters are written in frame-sized chunks (at most ~60 frames per
+    second) and each frame sleeps only until its deadline, so the animation
+    takes roughly ``len(text) * delay`` seconds without a write and a sleep
+    for every single character. The delay is scaled by SPEED.
+    """
+    delay *= SPEED
+    if delay <= 0:
+        print(text)
+        return
+
+    fps = min(60.0, 1 / delay)
+    chars_per_frame = max(1, int(round((1 / delay) / fps)))
+    frame_time = chars_per_frame * delay
+
+    deadline = time.monotonic()
+    for i in range(0, len(text), chars_per_frame):
+        sys.stdout.write(text[i : i + chars_per_frame])
+        sys.stdout.flush()
+        deadline += frame_time
+        slack = deadline - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
     print()
 
 
+def print_lines(lines: list, delay: float):
+    """Print a block of lines, revealing them in small batches.
+
+    When animating, lines are written ``LINES_PER_BATCH`` at a time with a
+    single pause per batch. Otherwise the whole block is written at once.
+    """
+    if SPEED <= 0:
+        sys.stdout.write("\n".join(lines) + "\n")
+        sys.stdout.flush()
+        return
+
+    for i in range(0, len(lines), LINES_PER_BATCH):
+        batch = lines[i : i + LINES_PER_BATCH]
+        print("\n".join(batch), flush=True)
+        pause(len(batch) * delay)
+
+
+DEMO_HEADER = "\n".join(
+    [
+        "🤖 " + "=" * 60,
+        "    Advanced AI Chatbot - DEMO MODE",
+        "=" * 64,
+        "",
+        "🎭 This demo shows what the chatbot can do without requiring an API key.",
+        "💡 To use the real AI chatbot, run: python advanced.py",
+        "",
+        "✨ Demo Features:",
+        "   • Example conversations",
+        "   • Feature demonstrations",
+        "   • Setup instructions",
+        "",
+        "🎬 Starting demo...",
+        "-" * 64,
+        "",
+    ]
+)
+
+
 def print_demo_header():
     """Print the demo header."""
-    print("🤖 " + "=" * 60)
-    print("    Advanced AI Chatbot - DEMO MODE")
-    print("=" * 64)
-    print()
-    print(
-        "🎭 This demo shows what the chatbot can do without requiring an API key."
-    )
-    print("💡 To use the real AI chatbot, run: python advanced.py")
-    print()
-    print("✨ Demo Features:")
-    print("   • Example conversations")
-    print("   • Feature demonstrations")
-    print("   • Setup instructions")
-    print()
-    print("🎬 Starting demo...")
-    print("-" * 64)
+    sys.stdout.write(DEMO_HEADER)
 
 
 def demo_conversation():
@@ -67,14 +162,14 @@ def demo_conversation():
         if speaker == "🤖":
             print(f"\n{speaker} Thinking", end="")
             for _ in range(3):
-                time.sleep(0.3)
+                pause(0.3)
                 print(".", end="", flush=True)
             print()
-            time.sleep(0.3)
+            pause(0.3)
 
         print(f"{speaker}: ", end="")
         print_typing_animation(message, 0.01)
-        time.sleep(1)
+        pause(1)
 
 
 def demo_commands():
@@ -86,7 +181,7 @@ def demo_commands():
         ("help", "Show available commands and usage tips"),
         ("clear", "Clear conversation history to start fresh"),
         ("summary", "Display conversation statistics and summary"),
-        ("save", "Save the current conversation to a JSON file"),
+        ("save", "Save the current conversation to a JSON Lines file"),
         ("quit/exit", "Exit the chatbot gracefully"),
     ]
 
@@ -119,7 +214,7 @@ def demo_features():
         "   • Helpful error messages and guidance",
         "",
         "📁 Conversation Management",
-        "   • Save conversations to JSON files",
+        "   • Save conversations to JSON Lines files",
         "   • Clear history when needed",
         "   • View conversation statistics",
         "",
@@ -129,9 +224,7 @@ def demo_features():
         "   • Clear error messages and solutions",
     ]
 
-    for feature in features:
-        print(feature)
-        time.sleep(0.3)
+    print_lines(features, 0.3)
 
 
 def demo_setup_guide():
@@ -161,9 +254,7 @@ def demo_setup_guide():
         "   • Run: python advanced.py",
     ]
 
-    for step in steps:
-        print(step)
-        time.sleep(0.2)
+    print_lines(steps, 0.2)
 
 
 def demo_cost_info():
@@ -190,13 +281,25 @@ def demo_cost_info():
         "   • Context is included in each request",
     ]
 
-    for line in info:
-        print(line)
-        time.sleep(0.3)
+    print_lines(info, 0.3)
 
 
 def main():
     """Run the demo."""
+    global SPEED
+
+    parser = argparse.ArgumentParser(
+        description="Demo script for the Advanced Mini Chatbot."
+    )
+    parser.add_argument(
+        "--fast",
+        action="store_true",
+        help="run the demo at 10x speed (see also the DEMO_SPEED variable)",
+    )
+    args = parser.parse_args()
+    if args.fast:
+        SPEED = min(SPEED, 0.1)
+
     print_demo_header()
 
     sections = [
@@ -209,11 +312,14 @@ def main():
 
     for i, (title, demo_func) in enumerate(sections, 1):
         print(f"\n🎬 Demo {i}/5: {title}")
-        time.sleep(1)
+        pause(1)
         demo_func()
 
         if i < len(sections):
-            input("\n⏯️  Press Enter to continue to the next demo...")
+            wait_or_enter(
+                "\n⏯️  Press Enter to continue to the next demo...",
+                10 * SPEED,
+            )
 
     print("\n" + "=" * 64)
     print("🎉 Demo Complete!")
@@ -27,39 +27,69 @@ import os
 import sys
 import time
 import json
+import shutil
+import tempfile
+import threading
 from typing import List, Optional
 from dataclasses import dataclass
 from datetime import datetime
 
-# Try to load environment variables from .env file
+# orjson is optional, it just encodes the conversation log faster
 try:
-    from dotenv import load_dotenv
+    import orjson
 
-    load_dotenv()
-except ImportError:
-    # dotenv is optional, will fall back to regular environment variables
-    pass
+    def _dump_json(obj) -> str:
+        return orjson.dumps(obj).decode("utf-8")
 
-try:
-    import google.generativeai as genai
 except ImportError:
-    print(
-        "Google Generative AI library not found. Please install it with: pip install google-generativeai"
-    )
-    sys.exit(1)
+
+    def _dump_json(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+# google.generativeai pulls in a large gRPC/protobuf stack, so it is only
+# imported once a chatbot is actually created (see _initialize_client)
+genai = None
+
+
+def _load_env():
+    """Load environment variables from a .env file, if dotenv is installed."""
+    try:
+        from dotenv import load_dotenv
+
+        load_dotenv()
+    except ImportError:
+        # dotenv is optional, will fall back to regular environment variables
+        pass
+
+
+# Message roles, interned so role checks can short-circuit on identity
+ROLE_USER = sys.intern("user")
+ROLE_ASSISTANT = sys.intern("assistant")
+ROLE_SYSTEM = sys.intern("system")
+
+# Frames of the spinner shown while waiting for the AI
+SPINNER_FRAMES = "⠋⠙⠹⠸⠼⠴⠦⠧⠇⠏"
+
+
+def _format_timestamp(timestamp_ns: int) -> str:
+    """Format a time.time_ns() timestamp as a local ISO 8601 string."""
+    seconds, nanoseconds = divmod(timestamp_ns, 1_000_000_000)
+    moment = datetime.fromtimestamp(seconds)
+    return moment.replace(microsecond=nanoseconds // 1000).isoformat()
 
 
 @dataclass
 class ChatMessage:
     """Represents a single chat message."""
 
-    role: str  # 'user', 'assistant', or 'system'
+    role: str  # ROLE_USER, ROLE_ASSISTANT, or ROLE_SYSTEM
     content: str
-    timestamp: Optional[datetime] = None
+    timestamp: Optional[int] = None  # nanoseconds since the epoch
 
     def __post_init__(self):
         if self.timestamp is None:
-            self.timestamp = datetime.now()
+            self.timestamp = time.time_ns()
 
 
 class AdvancedChatbot:
@@ -74,10 +104,18 @@ class AdvancedChatbot:
             api_key: Google AI API key. If None, will try to get from environment.
             model: The Gemini model to use for responses.
         """
+        _load_env()
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         self.model = model
         self.conversation_history: List[ChatMessage] = []
         self.chat_session = None
+        self._counts = self._empty_counts()
+
+        # Messages are appended to this JSON Lines log as they arrive, so
+        # saving only needs to copy it
+        self._log = tempfile.TemporaryFile(
+            "w+", encoding="utf-8", buffering=1, suffix=".jsonl"
+        )
 
         # System prompt to define the chatbot's personality
         self.system_prompt = """You are a friendly, helpful, and engaging chatbot assistant.
@@ -91,6 +129,16 @@ class AdvancedChatbot:
 
     def _initialize_client(self):
         """Initialize the Google AI client."""
+        global genai
+
+        try:
+            import google.generativeai as genai
+        except ImportError:
+            print(
+                "Google Generative AI library not found. Please install it with: pip install google-generativeai"
+            )
+            sys.exit(1)
+
         if not self.api_key:
             print("❌ Error: Google AI API key not found!")
             print("Please set your API key in one of these ways:")
@@ -102,13 +150,13 @@ class AdvancedChatbot:
             sys.exit(1)
 
         try:
+            # The key is checked by the first real request, and connection
+            # problems are reported by get_ai_response
             genai.configure(api_key=self.api_key)
-            # Test the connection by listing models
-            list(genai.list_models())
-            print("✅ Successfully connected to Google AI API")
+            print("✅ Google AI client configured")
         except Exception as e:
-            print(f"❌ Error connecting to Google AI API: {e}")
-            print("Please check your API key and internet connection.")
+            print(f"❌ Error configuring Google AI client: {e}")
+            print("Please check your API key.")
             sys.exit(1)
 
     def _start_chat_session(self):
@@ -121,21 +169,67 @@ class AdvancedChatbot:
 
             # Add system message to our internal history
             system_message = ChatMessage(
-                role="system", content=self.system_prompt
+                role=ROLE_SYSTEM, content=self.system_prompt
             )
-            self.conversation_history.append(system_message)
+            self._add_message(system_message)
 
         except Exception as e:
             print(f"❌ Error starting chat session: {e}")
             sys.exit(1)
 
-    def _typing_indicator(self, duration: float = 1.5):
-        """Show a typing indicator to simulate natural conversation flow."""
-        print("🤖 Thinking", end="", flush=True)
-        for _ in range(int(duration * 3)):
-            time.sleep(0.3)
-            print(".", end="", flush=True)
-        print()
+    @staticmethod
+    def _empty_counts() -> dict:
+        """Return a fresh per-role message counter."""
+        return {ROLE_USER: 0, ROLE_ASSISTANT: 0, ROLE_SYSTEM: 0}
+
+    def _add_message(self, message: ChatMessage):
+        """Add a message to the history and, unless it's a system message,
+        to the conversation log.
+
+        A message that can't be logged (e.g. text with invalid surrogates)
+        is still kept in the history, it just won't appear in saved files.
+        """
+        if message.role != ROLE_SYSTEM:  # Don't save system messages
+            record = {
+                "role": message.role,
+                "content": message.content,
+                "timestamp": _format_timestamp(message.timestamp),
+            }
+            try:
+                self._log.write(_dump_json(record) + "\n")
+            except (TypeError, ValueError, OSError) as e:
+                print(f"⚠️ This message won't be included when saving: {e}")
+
+        self.conversation_history.append(message)
+        self._counts[message.role] += 1
+
+    def _typing_indicator(self, stop: threading.Event, interval: float = 0.3):
+        """Show a typing indicator until the AI response arrives.
+
+        Runs in a background thread and redraws a spinner in place every
+        ``interval`` seconds, paced against a monotonic deadline, until
+        ``stop`` is set. When stdout isn't a terminal the indicator is
+        written once instead of being animated.
+        """
+        if not sys.stdout.isatty():
+            sys.stdout.write("🤖 Thinking...")
+            sys.stdout.flush()
+            stop.wait()
+            sys.stdout.write("\n")
+            sys.stdout.flush()
+            return
+
+        frame = 0
+        deadline = time.monotonic()
+        while True:
+            sys.stdout.write(f"\r🤖 Thinking {SPINNER_FRAMES[frame]}")
+            sys.stdout.flush()
+            deadline += interval
+            if stop.wait(max(0.0, deadline - time.monotonic())):
+                break
+            frame = (frame + 1) % len(SPINNER_FRAMES)
+        sys.stdout.write("\r🤖 Thinking...\n")
+        sys.stdout.flush()
 
     def get_ai_response(self, user_message: str) -> str:
         """Get AI response from Google Gemini API.
@@ -147,20 +241,28 @@ class AdvancedChatbot:
             AI-generated response string.
         """
         # Add user message to history
-        user_msg = ChatMessage(role="user", content=user_message)
-        self.conversation_history.append(user_msg)
+        user_msg = ChatMessage(role=ROLE_USER, content=user_message)
+        self._add_message(user_msg)
 
-        try:
-            # Show typing indicator
-            self._typing_indicator()
+        # Show typing indicator while waiting for the response
+        stop_typing = threading.Event()
+        indicator = threading.Thread(
+            target=self._typing_indicator, args=(stop_typing,), daemon=True
+        )
+        indicator.start()
 
+        try:
             # Send message to Gemini
-            response = self.chat_session.send_message(user_message)
-            ai_response = response.text
+            try:
+                response = self.chat_session.send_message(user_message)
+                ai_response = response.text
+            finally:
+                stop_typing.set()
+                indicator.join()
 
             # Add AI response to history
-            ai_msg = ChatMessage(role="assistant", content=ai_response)
-            self.conversation_history.append(ai_msg)
+            ai_msg = ChatMessage(role=ROLE_ASSISTANT, content=ai_response)
+            self._add_message(ai_msg)
 
             return ai_response
 
@@ -175,86 +277,110 @@ class AdvancedChatbot:
 
     def get_conversation_summary(self) -> str:
         """Get a summary of the conversation so far."""
-        if len(self.conversation_history) <= 1:  # Only system message
+        user_count = self._counts[ROLE_USER]
+        ai_count = self._counts[ROLE_ASSISTANT]
+        if not user_count and not ai_count:  # Only system message
             return "No conversation yet."
 
-        user_messages = [
-            msg for msg in self.conversation_history if msg.role == "user"
-        ]
-        ai_messages = [
-            msg for msg in self.conversation_history if msg.role == "assistant"
-        ]
-
-        return f"Conversation stats: {len(user_messages)} user messages, {len(ai_messages)} AI responses"
+        return f"Conversation stats: {user_count} user messages, {ai_count} AI responses"
 
     def save_conversation(self, filename: Optional[str] = None):
-        """Save the conversation to a JSON file."""
+        """Save the conversation to a JSON Lines file."""
         if filename is None:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"chatbot_conversation_{timestamp}.json"
-
-        conversation_data = []
-        for msg in self.conversation_history:
-            if msg.role != "system":  # Don't save system messages
-                conversation_data.append(
-                    {
-                        "role": msg.role,
-                        "content": msg.content,
-                        "timestamp": (
-                            msg.timestamp.isoformat()
-                            if msg.timestamp
-                            else datetime.now().isoformat()
-                        ),
-                    }
-                )
+            filename = f"chatbot_conversation_{timestamp}.jsonl"
 
         try:
+            self._log.seek(0)
             with open(filename, "w", encoding="utf-8") as f:
-                json.dump(conversation_data, f, indent=2, ensure_ascii=False)
+                shutil.copyfileobj(self._log, f)
             print(f"💾 Conversation saved to {filename}")
         except Exception as e:
             print(f"❌ Error saving conversation: {e}")
+        finally:
+            # Keep appending new messages at the end of the log
+            self._log.seek(0, os.SEEK_END)
 
     def clear_history(self):
         """Clear conversation history and start a new chat session."""
         self.conversation_history = []
+        self._counts = self._empty_counts()
+        self._log.seek(0)
+        self._log.truncate()
         self._start_chat_session()
         print("🗑️ Conversation history cleared.")
 
 
+QUIT_COMMANDS = frozenset({"quit", "exit", "bye"})
+
+
+WELCOME_MESSAGE = "\n".join(
+    [
+        "🤖 " + "=" * 60,
+        "    Welcome to the Advanced AI Chatbot!",
+        "=" * 64,
+        "",
+        "✨ Features:",
+        "   • Powered by Google's Gemini AI model",
+        "   • Natural conversation with memory",
+        "   • Type 'help' for commands",
+        "   • Type 'quit' or 'exit' to leave",
+        "",
+        "💬 Start chatting below:",
+        "-" * 64,
+        "",
+    ]
+)
+
+HELP_MESSAGE = "\n".join(
+    [
+        "",
+        "🔧 Available Commands:",
+        "   help        - Show this help message",
+        "   clear       - Clear conversation history",
+        "   summary     - Show conversation summary",
+        "   save        - Save conversation to file",
+        "   quit/exit   - Exit the chatbot",
+        "",
+        "",
+    ]
+)
+
+
 def print_welcome_message():
     """Print the welcome message with instructions."""
-    print("🤖 " + "=" * 60)
-    print("    Welcome to the Advanced AI Chatbot!")
-    print("=" * 64)
-    print()
-    print("✨ Features:")
-    print("   • Powered by Google's Gemini AI model")
-    print("   • Natural conversation with memory")
-    print("   • Type 'help' for commands")
-    print("   • Type 'quit' or 'exit' to leave")
-    print()
-    print("💬 Start chatting below:")
-    print("-" * 64)
+    sys.stdout.write(WELCOME_MESSAGE)
 
 
 def print_help():
     """Print available commands."""
-    print()
-    print("🔧 Available Commands:")
-    print("   help        - Show this help message")
-    print("   clear       - Clear conversation history")
-    print("   summary     - Show conversation summary")
-    print("   save        - Save conversation to file")
-    print("   quit/exit   - Exit the chatbot")
-    print()
+    sys.stdout.write(HELP_MESSAGE)
 
 
 def print_typing_animation(text: str, delay: float = 0.01):
-    """Print text with a typing animation effect."""
-    for char in text:
-        print(char, end="", flush=True)
-        time.sleep(delay)
+    """Print text with a typing animation effect.
+
+    Characters are written in frame-sized chunks (at most ~60 frames per
+    second) and each frame sleeps only until its deadline, so the animation
+    takes roughly ``len(text) * delay`` seconds without a write and a sleep
+    for every single character.
+    """
+    if delay <= 0:
+        print(text)
+        return
+
+    fps = min(60.0, 1 / delay)
+    chars_per_frame = max(1, int(round((1 / delay) / fps)))
+    frame_time = chars_per_frame * delay
+
+    deadline = time.monotonic()
+    for i in range(0, len(text), chars_per_frame):
+        sys.stdout.write(text[i : i + chars_per_frame])
+        sys.stdout.flush()
+        deadline += frame_time
+        slack = deadline - time.monotonic()
+        if slack > 0:
+            time.sleep(slack)
     print()
 
 
@@ -275,6 +401,14 @@ def main():
     )
     print()
 
+    # Commands handled locally instead of being sent to the AI
+    commands = {
+        "help": print_help,
+        "clear": chatbot.clear_history,
+        "summary": lambda: print(f"📊 {chatbot.get_conversation_summary()}"),
+        "save": chatbot.save_conversation,
+    }
+
     # Main conversation loop
     while True:
         try:
@@ -286,20 +420,13 @@ def main():
                 continue
 
             # Handle commands
-            if user_input.lower() in ["quit", "exit", "bye"]:
+            command = user_input.lower()
+            if command in QUIT_COMMANDS:
                 print("🤖 Thanks for chatting! Have a great day! 👋")
                 break
-            elif user_input.lower() == "help":
-                print_help()
-                continue
-            elif user_input.lower() == "clear":
-                chatbot.clear_history()
-                continue
-            elif user_input.lower() == "summary":
-                print(f"📊 {chatbot.get_conversation_summary()}")
-                continue
-            elif user_input.lower() == "save":
-                chatbot.save_conversation()
+            handler = commands.get(command)
+            if handler:
+                handler()
                 continue
 
             # Get AI response
@@ -23,7 +23,7 @@ def test_chatbot():
 
     # Try importing dependencies
     try:
-        import google.generativeai as genai
+        import google.generativeai  # noqa: F401
 
         print("✅ Google AI library imported successfully")
     except ImportError:
@@ -31,15 +31,6 @@ def test_chatbot():
         print("💡 Run: pip install google-generativeai")
         return False
 
-    # Test API connection
-    try:
-        genai.configure(api_key=api_key)
-        models = list(genai.list_models())
-        print(f"✅ API connection successful ({len(models)} models available)")
-    except Exception as e:
-        print(f"❌ API connection failed: {e}")
-        return False
-
     # Test chatbot initialization
     try:
         from main import AdvancedChatbot
@@ -50,11 +41,18 @@ def test_chatbot():
         print(f"❌ Chatbot initialization failed: {e}")
         return False
 
-    # Test simple conversation
+    # Test simple conversation, which is also the first real API call
     try:
+        from main import ROLE_ASSISTANT
+
         response = chatbot.get_ai_response(
             "Hello! Can you briefly introduce yourself?"
         )
+        # API errors are returned as a friendly message instead of raised,
+        # so check that the reply actually came from the model
+        if chatbot.conversation_history[-1].role != ROLE_ASSISTANT:
+            print(f"❌ API request failed: {response}")
+            return False
         print(f"✅ AI Response received: {response[:100]}...")
         return True
     except Exception as e:
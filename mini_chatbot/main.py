@@ -29,6 +29,10 @@ hobby_responses = [
     "{hobby}? Awesome!",
     "Everyone needs a hobby! {hobby} sounds interesting.",
 ]
+# Each response has exactly one placeholder, so split it into a
+# (prefix, suffix) pair once here instead of formatting on every call
+lang_responses = [tuple(s.split("{lang}")) for s in lang_responses]
+hobby_responses = [tuple(s.split("{hobby}")) for s in hobby_responses]
 jokes = [
     "Why do programmers prefer dark mode? Because light attracts bugs!",
     "Why do Java developers wear glasses? Because they don't see sharp!",
@@ -47,9 +51,9 @@ def get_user_name() -> str:
         str: The user's name, stripped of whitespace.
     """
     while True:
-        name = input("What's your name? ")
-        if name.strip():
-            return name.strip()
+        name = input("What's your name? ").strip()
+        if name:
+            return name
         else:
             print("Please enter a valid name.")
 
@@ -72,61 +76,81 @@ def get_user_age() -> int:
             print("That's not a valid age. Please enter a number.")
 
 
-def ask_basic_question():
+def ask_basic_question(word: str, lang_response: tuple) -> str:
     """Ask a basic question about programming preferences.
 
+    Args:
+        word (str): The word used to describe programming.
+        lang_response (tuple): The (prefix, suffix) reply used if the user
+            shares a favorite language.
+
     Returns:
         str: The user's response to the programming question.
     """
     print("Do you like programming?")
     answer = input("(yes/no): ").strip().lower()
-    if answer.startswith("y"):
-        print(
-            f"That's awesome! Programming is a {random.choice(word_bank)} skill."
-        )
-        ask_favorite_language()
-    elif answer.startswith("n"):
+    if answer[:1] == "y":
+        print(f"That's awesome! Programming is a {word} skill.")
+        ask_favorite_language(lang_response)
+    elif answer[:1] == "n":
         print("That's okay! There are many other interesting things to do.")
     else:
         print("I didn't understand your answer, but let's continue!")
     return answer
 
 
-def ask_favorite_language():
-    """Ask about the user's favorite programming language."""
+def ask_favorite_language(response: tuple):
+    """Ask about the user's favorite programming language.
+
+    Args:
+        response (tuple): The (prefix, suffix) pair to reply with.
+    """
     lang = input("What's your favorite programming language? ").strip()
     if lang:
-        print(random.choice(lang_responses).format(lang=lang))
+        prefix, suffix = response
+        print(f"{prefix}{lang}{suffix}")
     else:
         print("No favorite? That's okay!")
 
 
-def ask_hobby():
-    """Ask about the user's hobby."""
+def ask_hobby(response: tuple):
+    """Ask about the user's hobby.
+
+    Args:
+        response (tuple): The (prefix, suffix) pair to reply with.
+    """
     hobby = input("What do you like to do in your free time? ").strip()
     if hobby:
-        print(random.choice(hobby_responses).format(hobby=hobby))
+        prefix, suffix = response
+        print(f"{prefix}{hobby}{suffix}")
     else:
         print("Everyone needs a hobby! Maybe you'll find one soon.")
 
 
-def ask_joke():
+def ask_joke(joke: str):
     print("Would you like to hear a joke?")
     answer = input("(yes/no): ").strip().lower()
-    if answer.startswith("y"):
-        print(random.choice(jokes))
+    if answer[:1] == "y":
+        print(joke)
     else:
         print("No worries! Maybe next time.")
 
 
 def main():
     print("Hello! I am your mini chatbot.")
+    # The conversation is strictly sequential, so pick every random
+    # response up front
+    word = random.choice(word_bank)
+    lang_response = random.choice(lang_responses)
+    hobby_response = random.choice(hobby_responses)
+    joke = random.choice(jokes)
+
     name = get_user_name()
     age = get_user_age()
     print(f"Nice to meet you, {name.title()}! You are {age} years old.")
-    ask_basic_question()
-    ask_hobby()
-    ask_joke()
+    ask_basic_question(word, lang_response)
+    ask_hobby(hobby_response)
+    ask_joke(joke)
     print("It was nice chatting with you. Goodbye!")
 
 
@@ -7,32 +7,100 @@ The player has 3 attempts to guess the number correctly.
 The idea of the game is to provide a fun and interactive way to practice basic programming concepts.
 """
 
+import functools
 import random
 
-def main():
-    print("Welcome to the Number Guessing Game!")
-    print("I'm thinking of a number between 1 and 100.")
+# Numba is optional; without it play_round simply runs as plain Python
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        return lambda func: func
+
+# One generator for the whole module, seeded once at import
+_rng = random.Random()
+_getrandbits = _rng.getrandbits
+
+# Hints indexed by the comparison result + 1 (-1 too low, 1 too high)
+HINTS = ("Too low! Try again.", None, "Too high! Try again.")
+
+def pick_number() -> int:
+    """Pick a random number between 1 and 100 (inclusive)."""
+    while True:
+        n = _getrandbits(7)  # 0-127, retried until it lands in range
+        if 1 <= n <= 100:
+            return n
+
+@functools.lru_cache(maxsize=256)
+def respond(guess: int, target: int, attempts: int) -> tuple:
+    """Compare a guess with the target and build the message to show.
+
+    Results are cached, so scripted players repeating the same guesses
+    reuse the formatted message.
+
+    Returns:
+        tuple: (state, message) where state is -1 for too low, 1 for too
+        high and 0 for a correct guess.
+    """
+    cmp = (guess > target) - (guess < target)
+    if cmp == 0:
+        return 0, f"Congratulations! You've guessed the number {target} in {attempts} attempts."
+    return cmp, HINTS[cmp + 1]
+
+@njit(cache=True)
+def play_round(target, guesses):
+    """Play one round non-interactively, for self-play and benchmarks.
 
-    number_to_guess = random.randint(1, 100)
-    attempts = 3 # Number of attempts allowed
-    guess_found = False
+    Args:
+        target: The number to guess.
+        guesses: The guesses to try in order (a NumPy array when Numba is
+            installed, any sequence otherwise).
 
-    while attempts > 0:
+    Returns:
+        int: How many guesses it took to find the target, or -1 if none of
+        them matched.
+    """
+    for i in range(len(guesses)):
+        if guesses[i] == target:
+            return i + 1
+    return -1
+
+def read_guess() -> int:
+    """Prompt for a guess until the player enters a valid integer."""
+    while True:
         try:
-            guess = int(input("Enter your guess: "))
-            attempts -= 1
-
-            if guess < number_to_guess:
-                print("Too low! Try again.")
-            elif guess > number_to_guess:
-                print("Too high! Try again.")
-            else:
-                print(f"Congratulations! You've guessed the number {number_to_guess} in {attempts} attempts.")
-                guess_found = True
-                break
+            return int(input("Enter your guess: "))
         except ValueError:
             print("Please enter a valid integer.")
 
+def check_guess(target: int, attempts_left: int) -> bool:
+    """Play a single attempt and report whether the guess was correct.
+
+    Args:
+        target (int): The number to guess.
+        attempts_left (int): Attempts remaining after this one.
+
+    Returns:
+        bool: True if the player guessed the number.
+    """
+    state, message = respond(read_guess(), target, attempts_left)
+    print(message)
+    return state == 0
+
+def main():
+    print("Welcome to the Number Guessing Game!")
+    print("I'm thinking of a number between 1 and 100.")
+
+    number_to_guess = pick_number()
+
+    # The player always gets exactly 3 attempts, so they are written out
+    # one after another instead of counting down in a loop
+    guess_found = (
+        check_guess(number_to_guess, 2)
+        or check_guess(number_to_guess, 1)
+        or check_guess(number_to_guess, 0)
+    )
+
     if not guess_found:
         print(f"Sorry, you've run out of attempts. The number was {number_to_guess}.")
 
@@ -6,27 +6,90 @@ The simple banking app simulates basic banking operations such as displaying bal
 depositing money, and withdrawing money. It allows users to interactively manage their account balance.
 """
 
+import sys
+from typing import Optional
 
-def display_balance(balance: float) -> None:
-    print(f"Your account balance: ${balance}")
+MENU = (
+    "\nSimple Banking App\n"
+    "1. Display Balance\n"
+    "2. Deposit\n"
+    "3. Withdraw\n"
+    "4. Quit\n"
+    "Choose an option (1-4): "
+)
+MENU_BYTES = MENU.encode("utf-8")  # Encoded once, written as-is every time
 
 
-def deposit(balance: float) -> float:
-    amount = float(input("Enter amount to deposit: "))
+def format_cents(cents: int) -> str:
+    """Format an amount in cents as dollars, e.g. 1050 -> '$10.50'."""
+    return f"${cents // 100}.{cents % 100:02d}"
+
+
+def read_line() -> str:
+    """Read one line of input without its trailing newline.
+
+    Raises:
+        EOFError: If there is no more input, e.g. a script ran out of lines.
+    """
+    line = sys.stdin.readline()
+    if not line:
+        raise EOFError
+    return line.rstrip("\n")
+
+
+def read_choice() -> str:
+    """Show the menu and read the user's choice."""
+    sys.stdout.flush()  # Keep earlier print() output ahead of the menu
+    sys.stdout.buffer.write(MENU_BYTES)
+    sys.stdout.buffer.flush()
+    return read_line()
+
+
+def parse_cents(prompt: str) -> Optional[int]:
+    """Ask for an amount in dollars and return it in cents.
+
+    Returns:
+        Optional[int]: The amount in cents, or None if the input isn't a number.
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
+    try:
+        return round(float(read_line()) * 100)
+    except (ValueError, OverflowError):
+        print("Please enter a valid amount.")
+        return None
+
+
+def display_balance(balance: int) -> None:
+    print(f"Your account balance: {format_cents(balance)}")
+
+
+def deposit(balance: int) -> int:
+    amount = parse_cents("Enter amount to deposit: ")
+    if amount is None:
+        return balance
+
     if amount > 0:
         balance += amount
-        print(f"Deposited ${amount}. New balance: ${balance}")
+        print(
+            f"Deposited {format_cents(amount)}. New balance: {format_cents(balance)}"
+        )
     else:
         print("Deposit amount must be positive.")
     return balance
 
 
-def withdraw(balance: float) -> float:
-    amount = float(input("Enter amount to withdraw: "))
+def withdraw(balance: int) -> int:
+    amount = parse_cents("Enter amount to withdraw: ")
+    if amount is None:
+        return balance
+
     if amount > 0:
         if amount <= balance:
             balance -= amount
-            print(f"Withdrew ${amount}. New balance: ${balance}")
+            print(
+                f"Withdrew {format_cents(amount)}. New balance: {format_cents(balance)}"
+            )
         else:
             print("Insufficient funds.")
     else:
@@ -35,27 +98,26 @@ def withdraw(balance: float) -> float:
 
 
 def main():
-    balance = 0
+    balance = 0  # In cents, so balances stay exact integers
     while True:
-        print("\nSimple Banking App")
-        print("1. Display Balance")
-        print("2. Deposit")
-        print("3. Withdraw")
-        print("4. Quit")
-        choice = input("Choose an option (1-4): ")
-        print()
-
-        if choice == "1":
-            display_balance(balance)
-        elif choice == "2":
-            balance = deposit(balance)
-        elif choice == "3":
-            balance = withdraw(balance)
-        elif choice == "4":
-            print("Thank you for using the Simple Banking App. Goodbye!")
+        try:
+            choice = read_choice()
+            print()
+
+            if choice == "1":
+                display_balance(balance)
+            elif choice == "2":
+                balance = deposit(balance)
+            elif choice == "3":
+                balance = withdraw(balance)
+            elif choice == "4":
+                print("Thank you for using the Simple Banking App. Goodbye!")
+                break
+            else:
+                print("Invalid option. Please try again.")
+        except EOFError:
+            print()
             break
-        else:
-            print("Invalid option. Please try again.")
 
 
 if __name__ == "__main__":